@@ -11,6 +11,10 @@ from __future__ import annotations
 
 import os
 import json
+import math
+from textwrap import dedent
+from types import MappingProxyType
+from typing import Final
 from pydantic import BaseModel, Field
 from google.adk.agents import Agent
 from google.adk.tools import MCPToolset
@@ -26,47 +30,87 @@ class YouTubeOutput(BaseModel):
 
 # Anonymous MCP toolset (local developer tools at localhost:3001)
 _mcp_headers = None
-if os.getenv("MCP_EXTRA_HEADERS"):
+_raw_mcp_headers = os.getenv("MCP_EXTRA_HEADERS")
+if _raw_mcp_headers:
     try:
-        _mcp_headers = json.loads(os.getenv("MCP_EXTRA_HEADERS"))
+        # Read-only view, parsed once: the provider can hand it out per call
+        # without copying since ADK only merges it into its own headers dict.
+        _mcp_headers = MappingProxyType(json.loads(_raw_mcp_headers))
     except Exception:
         _mcp_headers = None
 
+
+# Upper bound for env-configured timeouts; ADK converts them to timedelta,
+# which overflows on inf or very large values.
+_MAX_TIMEOUT = 3600.0
+
+
+def _env_timeout(name: str, default: float) -> float:
+    """Read a timeout in seconds; blank, invalid or out-of-range values use `default`."""
+    try:
+        value = float(os.getenv(name) or default)
+    except ValueError:
+        return default
+    if not math.isfinite(value) or not 0 < value <= _MAX_TIMEOUT:
+        return default
+    return value
+
+
+# Connect/session-initialization timeout (ADK's default), and how long a single
+# tool call may wait for its result. Image generation polls for up to ~60s and
+# the upload OAuth flow gives up after 300s, so the read timeout stays above
+# that and the tool's own error reaches the user instead of a transport timeout.
+MCP_CONNECT_TIMEOUT = _env_timeout("MCP_CONNECT_TIMEOUT", 5.0)
+MCP_READ_TIMEOUT = _env_timeout("MCP_READ_TIMEOUT", 330.0)
+
 if _mcp_headers:
     def _header_provider(_: ReadonlyContext):
-        # Return a shallow copy to be safe
-        return dict(_mcp_headers)
+        return _mcp_headers
 
     mcp_tools = MCPToolset(
-        connection_params=StreamableHTTPConnectionParams(url="http://localhost:3001", headers=None),
+        connection_params=StreamableHTTPConnectionParams(
+            url="http://localhost:3001",
+            headers=None,
+            timeout=MCP_CONNECT_TIMEOUT,
+            sse_read_timeout=MCP_READ_TIMEOUT,
+        ),
         header_provider=_header_provider,
         require_confirmation=False,
     )
 else:
     mcp_tools = MCPToolset(
-        connection_params=StreamableHTTPConnectionParams(url="http://localhost:3001"),
+        connection_params=StreamableHTTPConnectionParams(
+            url="http://localhost:3001",
+            timeout=MCP_CONNECT_TIMEOUT,
+            sse_read_timeout=MCP_READ_TIMEOUT,
+        ),
         require_confirmation=False,
     )
 
 MODEL = os.getenv("GENERATOR_MODEL", "gemini-2.5-flash")
 
+# Sent verbatim on every model call: dedented and stripped once at import so no
+# source indentation or blank padding ends up in the prompt.
+INSTRUCTION: Final[str] = dedent("""
+    You are a YouTube assistant. Answer the user's latest message. A session
+    state variable `question`, if present, may also be used.
+
+    Tools (optional):
+    - Call toolset tools to fetch transcripts or video analytics when it helps
+      answer the message. List the tools you call in `tools_used` and summarize
+      their results in `answer`.
+    - Request independent tool calls (e.g. several videos or channels) together
+      in a single turn so they run concurrently.
+
+    Output fields: reasoning (list of short steps), answer, tools_used.
+    """).strip()
+
 
 root_agent = Agent(
         name="YouTubeAssistant",
         model=MODEL,
         description="Answer YouTube-related questions; optionally call local MCP tools.",
-        instruction="""
-You are a YouTube assistant. Answer the user's latest message using the chat
-conversation as context. If a session state variable `question` is present it
-may also be used, but it is optional.
-
-Tool behavior (optional):
-- You may call tools available in the toolset to fetch transcripts or video
-    analytics when it helps answer the user's message. If you call tools, list
-    their names in `tools_used` and summarize results in the `answer`.
-
-Return a JSON object with fields: reasoning (list of short steps), answer, tools_used.
-""",
+        instruction=INSTRUCTION,
         tools=[mcp_tools],
         include_contents="none",
         output_schema=YouTubeOutput,